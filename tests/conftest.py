@@ -0,0 +1,59 @@
+from functools import partial
+from http.server import SimpleHTTPRequestHandler
+from pathlib import Path
+
+import pytest
+
+from .utils import serve
+
+DATA_DIR = Path("tests/data/")
+
+
+@pytest.fixture(autouse=True)
+def vrplib_cache_dir(tmp_path, monkeypatch):
+    """
+    Points the download cache to a temporary directory, so that tests do
+    not read from or write to the user's cache.
+    """
+    path = tmp_path / "vrplib_cache"
+    monkeypatch.setenv("VRPLIB_CACHE_DIR", str(path))
+    return path
+
+
+@pytest.fixture(scope="session")
+def data_text():
+    """
+    Returns a function that gives the text of a file in the test data
+    directory. Files are read at most once per test session, since many
+    parametrized tests parse the same files.
+    """
+    cache: dict[str, str] = {}
+
+    def get(name: str) -> str:
+        if name not in cache:
+            with open(DATA_DIR / name, "r") as fh:
+                cache[name] = fh.read()
+
+        return cache[name]
+
+    return get
+
+
+@pytest.fixture
+def server_url(tmp_path, monkeypatch):
+    """
+    Serves the files in ``tmp_path`` over HTTP/1.1 on localhost, so that
+    connections can be kept alive. Proxy environment variables are unset
+    so that requests go to the server directly.
+    """
+    for var in ["http_proxy", "HTTP_PROXY"]:
+        monkeypatch.delenv(var, raising=False)
+
+    handler = partial(SimpleHTTPRequestHandler, directory=str(tmp_path))
+    handler.func.protocol_version = "HTTP/1.1"  # type: ignore
+    server = serve(handler)
+
+    yield f"http://127.0.0.1:{server.server_address[1]}/"
+
+    server.shutdown()
+    server.server_close()
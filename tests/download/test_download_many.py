@@ -0,0 +1,93 @@
+import os
+import shutil
+
+import pytest
+from numpy.testing import assert_, assert_equal
+
+from vrplib import download_many
+from vrplib.download import download_utils
+
+
+@pytest.fixture
+def local_cvrplib(tmp_path, server_url, monkeypatch):
+    """
+    Serves a copy of the X-n101-k25 files from a local server that stands in
+    for CVRPLIB.
+    """
+    (tmp_path / "X").mkdir()
+
+    for fname in ["X-n101-k25.vrp", "X-n101-k25.sol"]:
+        shutil.copy(f"tests/data/cvrplib/{fname}", tmp_path / "X" / fname)
+
+    monkeypatch.setattr(download_utils, "CVRPLIB_URL", server_url)
+
+
+def test_deprecation_warning(tmp_path, local_cvrplib):
+    """
+    Checks if a deprecation warning is raised when the function is called.
+    """
+    out = tmp_path / "out"
+    out.mkdir()
+
+    with pytest.warns(DeprecationWarning):
+        download_many(["X-n101-k25"], out)
+
+
+@pytest.mark.filterwarnings("ignore:The function")
+def test_raise_invalid_name(tmp_path):
+    """
+    Raise an error if one of the passed-in names is invalid.
+    """
+    with pytest.raises(ValueError):
+        download_many(["X-n101-k25", "invalid_name"], tmp_path)
+
+
+@pytest.mark.filterwarnings("ignore:The function")
+def test_raise_not_a_directory(tmp_path):
+    """
+    Raise an error if the passed-in path is not a directory.
+    """
+    with pytest.raises(ValueError):
+        download_many(["X-n101-k25"], tmp_path / "not_a_directory")
+
+
+@pytest.mark.filterwarnings("ignore:The function")
+def test_download_many_local(tmp_path, local_cvrplib):
+    """
+    Tests that instances and solutions are downloaded to the passed-in
+    directory, using a local server in place of CVRPLIB.
+    """
+    out = tmp_path / "out"
+    out.mkdir()
+
+    download_many(["X-n101-k25"], out, solution=True)
+
+    for fname in ["X-n101-k25.vrp", "X-n101-k25.sol"]:
+        with open(out / fname, "r") as fi:
+            actual = fi.read()
+
+        with open(f"tests/data/cvrplib/{fname}", "r") as fi:
+            desired = fi.read()
+
+        assert_equal(actual, desired)
+
+
+@pytest.mark.filterwarnings("ignore:The function")
+def test_download_many(tmp_path):
+    """
+    Tests if multiple instances and their solutions are correctly downloaded
+    from CVRPLIB and saved to the passed-in directory.
+    """
+    files = ["X-n101-k25.vrp", "X-n101-k25.sol", "C101.txt", "C101.sol"]
+    download_many(["X-n101-k25", "C101"], tmp_path, solution=True)
+
+    for fname in files:
+        assert_(os.path.exists(tmp_path / fname))
+
+        with open(tmp_path / fname, "r") as fi:
+            actual = fi.read()
+
+        with open(f"tests/data/cvrplib/{fname}", "r") as fi:
+            desired = fi.read()
+
+        assert_equal(actual, desired)
@@ -1,9 +1,40 @@
+import gzip
+from concurrent.futures import ThreadPoolExecutor
+from http.client import IncompleteRead
+from http.server import BaseHTTPRequestHandler
+from urllib.error import HTTPError
+from urllib.parse import urlsplit
+
 import pytest
-from numpy.testing import assert_equal
+from numpy.testing import assert_, assert_equal
+
+from vrplib.download.download_utils import (
+    clear_cache,
+    close_connections,
+    download_file,
+    find_set,
+    instance_url,
+    solution_url,
+    thread_connections,
+)
+
+from ..utils import selected_cases, serve
+
+
+class EchoProxyHandler(BaseHTTPRequestHandler):
+    """
+    Proxy stub that responds with the request target it received.
+    """
 
-from vrplib.download.download_utils import find_set
+    protocol_version = "HTTP/1.1"
 
-from ..utils import selected_cases
+    def do_GET(self):
+        body = self.path.encode()
+
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
 
 
 @pytest.mark.parametrize("case", selected_cases())
@@ -14,3 +45,282 @@ def test_find_dir(case):
 def test_raise_invalid_name():
     with pytest.raises(ValueError):
         find_set("test_name")
+
+
+@pytest.mark.parametrize(
+    "name, instance, solution",
+    [
+        ("X-n101-k25", "X/X-n101-k25.vrp", "X/X-n101-k25.sol"),
+        ("C101", "Solomon/C101.txt", "Solomon/C101.sol"),
+        ("C1_2_1", "HG/C1_2_1.txt", "HG/C1_2_1.sol"),
+    ],
+)
+def test_instance_and_solution_url(name, instance, solution):
+    assert_(instance_url(name).endswith("/" + instance))
+    assert_(solution_url(name).endswith("/" + solution))
+
+
+def test_download_file_consecutive(tmp_path, server_url):
+    """
+    Tests that consecutive downloads from the same host return the file
+    contents.
+    """
+    (tmp_path / "first.txt").write_bytes(b"first")
+    (tmp_path / "second.txt").write_bytes(b"second")
+
+    download_file(server_url + "first.txt", tmp_path / "first.out")
+    download_file(server_url + "second.txt", tmp_path / "second.out")
+
+    assert_equal((tmp_path / "first.out").read_bytes(), b"first")
+    assert_equal((tmp_path / "second.out").read_bytes(), b"second")
+
+
+def test_download_file_concurrent(tmp_path, server_url):
+    """
+    Tests that downloading files concurrently from multiple threads returns
+    the correct contents for each file.
+    """
+    names = [f"{idx}.txt" for idx in range(16)]
+    for name in names:
+        (tmp_path / name).write_text(name)
+
+    def download(name):
+        download_file(server_url + name, tmp_path / (name + ".out"))
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(download, names))
+
+    for name in names:
+        assert_equal((tmp_path / (name + ".out")).read_text(), name)
+
+
+def test_download_file_timeout(tmp_path, server_url):
+    """
+    Tests that the passed-in timeout is applied to a reused connection.
+    """
+    url = server_url + "instance.vrp"
+    (tmp_path / "instance.vrp").write_bytes(b"NAME: instance\n")
+
+    for timeout in [30, 5]:
+        download_file(url, tmp_path / "out.vrp", timeout=timeout)
+
+    conn = thread_connections()[("http", urlsplit(url).netloc)]
+    assert_equal(conn.timeout, 5)
+    assert_equal(conn.sock.gettimeout(), 5)
+
+
+class RedirectLoopHandler(BaseHTTPRequestHandler):
+    """
+    Server stub that redirects every request to itself.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b"moved"
+
+        self.send_response(302)
+        self.send_header("Location", self.path)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def test_download_file_raise_too_many_redirects(tmp_path, monkeypatch):
+    """
+    Raise an HTTPError when the server keeps redirecting, and do not write
+    the body of the last redirect to the file.
+    """
+    for var in ["http_proxy", "HTTP_PROXY"]:
+        monkeypatch.delenv(var, raising=False)
+
+    server = serve(RedirectLoopHandler)
+    url = f"http://127.0.0.1:{server.server_address[1]}/instance.vrp"
+    path = tmp_path / "instance.vrp"
+
+    with pytest.raises(HTTPError):
+        download_file(url, path)
+
+    assert_(not path.exists())
+
+    server.shutdown()
+    server.server_close()
+
+
+class TruncatedHandler(BaseHTTPRequestHandler):
+    """
+    Server stub that closes the connection before the full body is sent.
+    The path selects a plain body with a too large Content-Length, or a
+    cut-off gzip stream.
+    """
+
+    def do_GET(self):
+        self.send_response(200)
+
+        if self.path == "/gzip":
+            body = gzip.compress(b"NAME: instance\n" * 1000)
+            body = body[: len(body) // 2]
+            self.send_header("Content-Encoding", "gzip")
+        else:
+            body = b"NAME: in"
+            self.send_header("Content-Length", "1000")
+
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.mark.parametrize("target", ["plain", "gzip"])
+def test_download_file_raise_truncated(tmp_path, monkeypatch, target):
+    """
+    Raise an IncompleteRead when the response body is cut off, and do not
+    leave the partial file behind.
+    """
+    for var in ["http_proxy", "HTTP_PROXY"]:
+        monkeypatch.delenv(var, raising=False)
+
+    server = serve(TruncatedHandler)
+    url = f"http://127.0.0.1:{server.server_address[1]}/{target}"
+    path = tmp_path / "instance.vrp"
+
+    with pytest.raises(IncompleteRead):
+        download_file(url, path)
+
+    assert_(not path.exists())
+
+    server.shutdown()
+    server.server_close()
+
+
+def test_download_file_cache_truncated(
+    tmp_path, monkeypatch, vrplib_cache_dir
+):
+    """
+    Tests that a truncated download is not stored in the cache.
+    """
+    for var in ["http_proxy", "HTTP_PROXY"]:
+        monkeypatch.delenv(var, raising=False)
+
+    server = serve(TruncatedHandler)
+    url = f"http://127.0.0.1:{server.server_address[1]}/plain"
+
+    with pytest.raises(IncompleteRead):
+        download_file(url, tmp_path / "instance.vrp", cache=True)
+
+    files = vrplib_cache_dir.rglob("*")
+    assert_equal([path for path in files if path.is_file()], [])
+
+    server.shutdown()
+    server.server_close()
+
+
+def test_download_file_proxy(tmp_path, monkeypatch):
+    """
+    Tests that plain HTTP requests are sent through the proxy set in the
+    environment.
+    """
+    proxy = serve(EchoProxyHandler)
+    proxy_url = f"http://127.0.0.1:{proxy.server_address[1]}"
+
+    monkeypatch.setenv("http_proxy", proxy_url)
+    monkeypatch.delenv("no_proxy", raising=False)
+    monkeypatch.delenv("NO_PROXY", raising=False)
+
+    url = "http://vrplib.invalid/instance.vrp"
+    download_file(url, tmp_path / "instance.vrp")
+
+    assert_equal((tmp_path / "instance.vrp").read_bytes(), url.encode())
+
+    proxy.shutdown()
+    proxy.server_close()
+
+
+def test_download_file(tmp_path, server_url):
+    """
+    Tests that a file larger than a single chunk is correctly streamed to
+    the passed-in file path.
+    """
+    contents = b"NAME: instance\n" * 10_000
+    (tmp_path / "instance.vrp").write_bytes(contents)
+
+    path = tmp_path / "downloaded.vrp"
+    download_file(server_url + "instance.vrp", path)
+
+    assert_equal(path.read_bytes(), contents)
+
+
+def test_download_file_not_found(tmp_path, server_url):
+    """
+    Raise an HTTPError if the requested file does not exist, and do not
+    write a file in that case.
+    """
+    path = tmp_path / "downloaded.vrp"
+
+    with pytest.raises(HTTPError):
+        download_file(server_url + "does_not_exist.vrp", path)
+
+    assert_(not path.exists())
+
+
+def test_download_file_raise_open_error(tmp_path, server_url):
+    """
+    Tests that an error when opening the target file is raised as is, and
+    that the connection can be reused afterwards.
+    """
+    url = server_url + "instance.vrp"
+    (tmp_path / "instance.vrp").write_bytes(b"NAME: instance\n")
+    path = tmp_path / "missing_dir" / "instance.vrp"
+
+    with pytest.raises(FileNotFoundError) as excinfo:
+        download_file(url, path)
+
+    assert_equal(excinfo.value.filename, str(path))
+    assert_(excinfo.value.__context__ is None)
+
+    download_file(url, tmp_path / "out.vrp")
+    assert_equal((tmp_path / "out.vrp").read_bytes(), b"NAME: instance\n")
+
+
+def test_download_file_cache(tmp_path, server_url, vrplib_cache_dir):
+    """
+    Tests that a cached file is served from the cache, even if it is no
+    longer available on the server, until the cache is cleared.
+    """
+    url = server_url + "instance.vrp"
+    source = tmp_path / "instance.vrp"
+    source.write_bytes(b"NAME: instance\n")
+
+    download_file(url, tmp_path / "first.vrp", cache=True)
+    source.unlink()
+
+    download_file(url, tmp_path / "second.vrp", cache=True)
+    assert_equal((tmp_path / "second.vrp").read_bytes(), b"NAME: instance\n")
+
+    clear_cache()
+
+    with pytest.raises(HTTPError):
+        download_file(url, tmp_path / "third.vrp", cache=True)
+
+    # The failed download should not leave temporary files in the cache.
+    files = vrplib_cache_dir.rglob("*")
+    assert_equal([path for path in files if path.is_file()], [])
+
+
+def test_close_connections(tmp_path, server_url):
+    """
+    Tests that closing the connections of the current thread closes their
+    sockets, and that a later download opens a new connection.
+    """
+    url = server_url + "instance.vrp"
+    (tmp_path / "instance.vrp").write_bytes(b"NAME: instance\n")
+    download_file(url, tmp_path / "first.vrp")
+
+    connections = thread_connections()
+    conns = list(connections.values())
+    close_connections(connections)
+
+    assert_equal(len(connections), 0)
+    assert_(all(conn.sock is None for conn in conns))
+
+    download_file(url, tmp_path / "second.vrp")
+    assert_equal((tmp_path / "second.vrp").read_bytes(), b"NAME: instance\n")
@@ -1,13 +1,9 @@
-from pathlib import Path
-
 import numpy as np
 from numpy.testing import assert_, assert_equal, assert_raises
 from pytest import mark
 
 from vrplib.parse.parse_solomon import parse_solomon
 
-DATA_DIR = Path("tests/data")
-
 
 @mark.parametrize(
     "name",
@@ -25,10 +21,9 @@ DATA_DIR = Path("tests/data")
         "X-n101-k25.vrp",
     ],
 )
-def test_raise_invalid_solomon_instance_file(name):
+def test_raise_invalid_solomon_instance_file(name, data_text):
     with assert_raises(RuntimeError):
-        with open(DATA_DIR / name, "r") as fh:
-            parse_solomon(fh.read())
+        parse_solomon(data_text(name))
 
 
 @mark.parametrize(
@@ -53,9 +48,8 @@ def test_raise_invalid_solomon_instance_lines(lines):
 
 
 @mark.parametrize("name", ["C101.txt", "C1_2_1.txt"])
-def test_does_not_raise(name):
-    with open(DATA_DIR / name, "r") as fh:
-        parse_solomon(fh.read())
+def test_does_not_raise(name, data_text):
+    parse_solomon(data_text(name))
 
 
 SOLOMON_INSTANCE = [
@@ -20,6 +20,10 @@ from vrplib.parse.parse_solution import parse_solution
             "Route #1: 1 \n Route #2: 6\n time 180.23",
             {"routes": [[1], [6]], "time": 180.23},
         ),
+        (  # empty routes and irregular whitespace
+            "Route #1: \n Route #2:  5   6 \n Route #3:",
+            {"routes": [[], [5, 6], []]},
+        ),
         (  # skip lines without : or space
             "Route #1: 1 \n Route #2: 6\n ABCDE",
             {"routes": [[1], [6]]},
@@ -31,3 +35,18 @@ def test_parse_solution(text, data):
     Tests if a solution is correctly parsed.
     """
     assert_equal(parse_solution(text), data)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "Route #1: 1 2 a 3",  # non-integer token
+        "Route #1: 1 2.5 3",  # float
+    ],
+)
+def test_parse_solution_raise_malformed_route(text):
+    """
+    Tests if a ValueError is raised when a route is malformed.
+    """
+    with pytest.raises(ValueError):
+        parse_solution(text)
@@ -1,5 +1,3 @@
-from pathlib import Path
-
 import numpy as np
 from numpy.testing import assert_, assert_equal, assert_raises
 from pytest import mark
@@ -11,8 +9,6 @@ from vrplib.parse.parse_vrplib import (
     parse_vrplib,
 )
 
-DATA_DIR = Path("tests/data/")
-
 
 @mark.parametrize(
     "name",
@@ -23,13 +19,12 @@ DATA_DIR = Path("tests/data/")
         "NoColonSpecification.txt",
     ],
 )
-def test_raise_invalid_vrplib_format(name):
+def test_raise_invalid_vrplib_format(name, data_text):
     """
     Tests if a RuntimeError is raised when the text is not in VRPLIB format.
     """
-    with open(DATA_DIR / name, "r") as fh:
-        with assert_raises(RuntimeError):
-            parse_vrplib(fh.read())
+    with assert_raises(RuntimeError):
+        parse_vrplib(data_text(name))
 
 
 @mark.parametrize(
@@ -47,9 +42,8 @@ def test_raise_invalid_vrplib_format(name):
         "X-n101-k25.vrp",
     ],
 )
-def test_no_raise_valid_vrplib_format(name):
-    with open(DATA_DIR / name, "r") as fh:
-        parse_vrplib(fh.read())
+def test_no_raise_valid_vrplib_format(name, data_text):
+    parse_vrplib(data_text(name))
 
 
 def test_group_specifications_and_sections():
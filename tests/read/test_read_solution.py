@@ -32,3 +32,17 @@ def test_read_dummy_solution(tmp_path):
     }
 
     assert_equal(read_solution(tmp_path / name), target)
+
+
+def test_read_non_utf8_solution(tmp_path):
+    """
+    Tests if a solution with non-UTF-8 bytes (here, a latin-1 comment) is
+    still read.
+    """
+    path = tmp_path / "test.sol"
+    path.write_bytes("Route #1: 1 2\nComment: Café\n".encode("latin-1"))
+
+    solution = read_solution(path)
+
+    assert_equal(solution["routes"], [[1, 2]])
+    assert_equal(solution["comment"], "Caf�")
@@ -1,4 +1,6 @@
+import threading
 from dataclasses import dataclass
+from http.server import ThreadingHTTPServer
 from pathlib import Path
 
 from vrplib.download.download_utils import find_set
@@ -77,3 +79,15 @@ def selected_cases():
         P,
         X,
     ]
+
+
+def serve(handler) -> ThreadingHTTPServer:
+    """
+    Serves the passed-in request handler on localhost in a background thread.
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    return server
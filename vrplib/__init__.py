@@ -1,3 +1,9 @@
-from .download import download_instance, download_solution, list_names
+from .download import (
+    clear_cache,
+    download_instance,
+    download_many,
+    download_solution,
+    list_names,
+)
 from .read import read_instance, read_solution
 from .write import write_instance, write_solution
@@ -1,3 +1,5 @@
 from .download_instance import download_instance
+from .download_many import download_many
 from .download_solution import download_solution
+from .download_utils import clear_cache
 from .list_names import list_names
@@ -2,10 +2,8 @@ import os
 import warnings
 from pathlib import Path
 from typing import Union
-from urllib.request import urlopen
 
-from .constants import CVRPLIB_URL
-from .download_utils import find_set, is_vrptw
+from .download_utils import download_file, instance_url
 
 
 def download_instance(name: str, path: Union[str, os.PathLike]):
@@ -21,6 +19,12 @@ def download_instance(name: str, path: Union[str, os.PathLike]):
         The path where the instance file should be saved. If a directory is
         specified, the file will be saved in that directory with the original
         file name.
+
+    Notes
+    -----
+    Instance files do not change, so they are cached on disk after the first
+    download. See `vrplib.download.download_utils.cache_dir` for the cache
+    location, and use `vrplib.clear_cache()` to empty the cache.
     """
     msg = (
         "The function 'download_instance' is deprecated and will be removed"
@@ -28,14 +32,9 @@ def download_instance(name: str, path: Union[str, os.PathLike]):
     )
     warnings.warn(msg, DeprecationWarning)
 
-    ext = "txt" if is_vrptw(name) else "vrp"
-    url = CVRPLIB_URL + f"{find_set(name)}/{name}.{ext}"
-    response = urlopen(url, timeout=30)
-
-    instance_text = response.read().decode("utf-8")
+    url = instance_url(name)
 
     if os.path.isdir(path):
-        path = Path(path) / f"{name}.{ext}"
+        path = Path(path) / url.rsplit("/", 1)[-1]
 
-    with open(path, "w") as fi:
-        fi.write(instance_text)
+    download_file(url, path, cache=True)
@@ -0,0 +1,74 @@
+import os
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Sequence, Union
+
+from .download_utils import (
+    close_connections,
+    download_file,
+    instance_url,
+    solution_url,
+    thread_connections,
+)
+
+
+def download_many(
+    names: Sequence[str],
+    path: Union[str, os.PathLike],
+    solution: bool = False,
+    max_workers: int = 16,
+):
+    """
+    Downloads multiple instance files from CVRPLIB and saves them in the
+    specified directory. The files are downloaded concurrently.
+
+    Parameters
+    ----------
+    names
+        The names of the instances to download. Should be names listed in
+        `vrplib.list_names()`.
+    path
+        The directory where the files should be saved. The files are saved
+        with their original file names.
+    solution
+        Whether to also download the solution file of each instance.
+        Defaults to False.
+    max_workers
+        The maximum number of concurrent downloads. Defaults to 16.
+    """
+    msg = (
+        "The function 'download_many' is deprecated and will be removed"
+        " in the next major version (vrplib v2.0.0)."
+    )
+    warnings.warn(msg, DeprecationWarning)
+
+    if not os.path.isdir(path):
+        raise ValueError(f"Path {path} is not a directory.")
+
+    urls = []  # pairs of (url, whether to use the cache)
+    for name in names:
+        urls.append((instance_url(name), True))
+
+        if solution:
+            urls.append((solution_url(name), False))
+
+    def download(url: str, cache: bool):
+        download_file(url, Path(path) / url.rsplit("/", 1)[-1], cache)
+
+    # Each worker thread keeps its own connections alive. We collect them so
+    # they can be closed once the workers are done.
+    worker_connections = []
+
+    def init_worker():
+        worker_connections.append(thread_connections())
+
+    try:
+        with ThreadPoolExecutor(max_workers, initializer=init_worker) as ex:
+            futures = [ex.submit(download, *args) for args in urls]
+
+            for future in futures:  # propagates exceptions raised in workers
+                future.result()
+    finally:
+        for connections in worker_connections:
+            close_connections(connections)
@@ -2,10 +2,8 @@ import os
 import warnings
 from pathlib import Path
 from typing import Union
-from urllib.request import urlopen
 
-from .constants import CVRPLIB_URL
-from .download_utils import find_set
+from .download_utils import download_file, solution_url
 
 
 def download_solution(name: str, path: Union[str, os.PathLike]):
@@ -28,13 +26,9 @@ def download_solution(name: str, path: Union[str, os.PathLike]):
     )
     warnings.warn(msg, DeprecationWarning)
 
-    url = CVRPLIB_URL + f"{find_set(name)}/{name}.sol"
-    response = urlopen(url, timeout=30)
-
-    solution_text = response.read().decode("utf-8")
+    url = solution_url(name)
 
     if os.path.isdir(path):
         path = Path(path) / f"{name}.sol"
 
-    with open(path, "w") as fi:
-        fi.write(solution_text)
+    download_file(url, path)
@@ -1,8 +1,262 @@
+import atexit
+import contextlib
+import os
 import re
+import shutil
+import tempfile
+import threading
+import zlib
+from functools import lru_cache
+from http.client import (
+    HTTPConnection,
+    HTTPException,
+    HTTPResponse,
+    HTTPSConnection,
+    IncompleteRead,
+)
+from pathlib import Path
+from typing import Iterator, Optional, Union
+from urllib.error import HTTPError
+from urllib.parse import urljoin, urlsplit
+from urllib.request import Request, getproxies, proxy_bypass, urlopen
 
-from .constants import CVRP_SETS, DIMACS_NAMES, XXL_NAMES
+from .constants import (
+    CVRP_SETS,
+    CVRPLIB_URL,
+    DIMACS_NAMES,
+    VRPTW_SETS,
+    XXL_NAMES,
+)
 
+# Open connections per (scheme, host), kept alive between downloads. An
+# HTTP connection cannot be shared between threads, so each thread keeps
+# its own connections.
+_LOCAL = threading.local()
+_OPEN_CONNECTIONS: dict[int, dict[tuple, HTTPConnection]] = {}
 
+_CHUNK_SIZE = 64 * 1024
+
+
+def download_file(
+    url: str,
+    path: Union[str, os.PathLike],
+    cache: bool = False,
+    timeout: float = 30,
+    max_redirects: int = 5,
+):
+    """
+    Downloads the contents of the passed-in URL to the specified file path.
+    Connections are kept alive and reused for subsequent requests to the
+    same host, so that consecutive downloads from CVRPLIB skip the connection
+    setup. Proxies set in the ``HTTP_PROXY`` and ``HTTPS_PROXY`` environment
+    variables are used, through ``urlopen``. This function is thread-safe,
+    so multiple files can be downloaded concurrently. The response is
+    requested gzip-compressed and streamed to the file in chunks, so the
+    full file contents are never held in memory.
+
+    Parameters
+    ----------
+    url
+        The URL to download.
+    path
+        The file path where the contents should be saved.
+    cache
+        Whether to use the on-disk download cache. If True, the file is
+        copied from the cache when present, and stored in the cache after
+        downloading otherwise. Only use this for files that do not change,
+        such as instances. Defaults to False.
+    timeout
+        The connection timeout in seconds. Defaults to 30.
+    max_redirects
+        The maximum number of redirects to follow. Defaults to 5. When a
+        proxy is used, urllib's own redirect limit applies instead.
+
+    Raises
+    ------
+    HTTPError
+        When the server responds with an error status code, or redirects
+        more than ``max_redirects`` times. No file is written in that case.
+    IncompleteRead
+        When the connection is closed before the full response is received.
+        No file is written in that case.
+    """
+    if cache:
+        parts = urlsplit(url)
+        cached = cache_dir() / parts.netloc / parts.path.lstrip("/")
+
+        if not cached.exists():
+            # Download to a temporary file first, and only move it into the
+            # cache once the download completed; download_file raises on
+            # error responses and truncated bodies.
+            cached.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=cached.parent)
+            os.close(fd)
+
+            try:
+                download_file(url, tmp, False, timeout, max_redirects)
+                os.replace(tmp, cached)
+            except BaseException:
+                # The temporary file may already have been removed if the
+                # download failed while streaming.
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(tmp)
+                raise
+
+        shutil.copyfile(cached, path)
+        return
+
+    conn, response = _open(url, timeout, max_redirects)
+
+    try:
+        fi = open(path, "wb")
+    except BaseException:
+        # The unread response body would block the kept-alive connection.
+        (conn or response).close()
+        raise
+
+    try:
+        with fi:
+            for chunk in _iter_content(response):
+                fi.write(chunk)
+    except BaseException:
+        # Do not leave a partially downloaded file behind, and drop the
+        # connection since the rest of the response was not read.
+        (conn or response).close()
+        os.remove(path)
+        raise
+
+
+def cache_dir() -> Path:
+    """
+    Returns the directory of the on-disk download cache. This is the
+    ``VRPLIB_CACHE_DIR`` environment variable if set, and ``~/.cache/vrplib``
+    otherwise.
+    """
+    default = Path.home() / ".cache" / "vrplib"
+    return Path(os.environ.get("VRPLIB_CACHE_DIR", default))
+
+
+def clear_cache():
+    """
+    Removes all files from the on-disk download cache.
+    """
+    shutil.rmtree(cache_dir(), ignore_errors=True)
+
+
+def thread_connections() -> dict[tuple, HTTPConnection]:
+    """
+    Returns the kept-alive connections of the current thread.
+    """
+    if not hasattr(_LOCAL, "connections"):
+        _LOCAL.connections = {}
+
+    # Registered so that connections not closed explicitly are closed when
+    # the interpreter exits.
+    _OPEN_CONNECTIONS[id(_LOCAL.connections)] = _LOCAL.connections
+    return _LOCAL.connections
+
+
+def close_connections(connections: dict[tuple, HTTPConnection]):
+    """
+    Closes and forgets the passed-in connections, as returned by
+    `thread_connections`. Must not be called while the connections are in
+    use by another thread.
+    """
+    for conn in connections.values():
+        conn.close()
+
+    connections.clear()
+    _OPEN_CONNECTIONS.pop(id(connections), None)
+
+
+@atexit.register
+def _close_all_connections():
+    for connections in list(_OPEN_CONNECTIONS.values()):
+        close_connections(connections)
+
+
+def _open(
+    url: str, timeout: float, max_redirects: int
+) -> tuple[Optional[HTTPConnection], HTTPResponse]:
+    """
+    Sends a GET request to the passed-in URL over a kept-alive connection
+    and returns the connection and the response, with the body not yet read.
+    If a proxy is configured, the request is left to ``urlopen`` instead and
+    no connection is returned.
+    """
+    parts = urlsplit(url)
+    headers = {"Accept-Encoding": "gzip", "Connection": "keep-alive"}
+
+    proxy = getproxies().get(parts.scheme)
+
+    if proxy and not proxy_bypass(parts.hostname or ""):
+        # Proxies (tunnelling, authentication) are handled by urllib.
+        request = Request(url, headers={"Accept-Encoding": "gzip"})
+        return None, urlopen(request, timeout=timeout)
+
+    target = parts.path + (f"?{parts.query}" if parts.query else "")
+    connections = thread_connections()
+
+    key = (parts.scheme, parts.netloc)
+    if key not in connections:
+        cls = HTTPSConnection if parts.scheme == "https" else HTTPConnection
+        connections[key] = cls(parts.netloc, timeout=timeout)
+
+    conn = connections[key]
+    conn.timeout = timeout
+
+    if conn.sock is not None:
+        conn.sock.settimeout(timeout)
+
+    try:
+        conn.request("GET", target, headers=headers)
+        response = conn.getresponse()
+    except (HTTPException, ConnectionError):
+        # The server may have closed the idle connection, so we retry once
+        # on a fresh connection.
+        conn.close()
+        conn.request("GET", target, headers=headers)
+        response = conn.getresponse()
+
+    if 300 <= response.status < 400 and max_redirects > 0:
+        response.read()  # drain, so the connection can be reused
+        location = urljoin(url, response.getheader("Location", ""))
+        return _open(location, timeout, max_redirects - 1)
+
+    if response.status >= 300:  # errors, or redirects beyond the maximum
+        response.read()
+        raise HTTPError(
+            url, response.status, response.reason, response.headers, None
+        )
+
+    return conn, response
+
+
+def _iter_content(response: HTTPResponse) -> Iterator[bytes]:
+    """
+    Yields the (decompressed) response body in chunks.
+    """
+    if response.getheader("Content-Encoding") == "gzip":
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    else:
+        decompressor = None
+
+    while chunk := response.read(_CHUNK_SIZE):
+        yield decompressor.decompress(chunk) if decompressor else chunk
+
+    # Reads stop silently when the server closes the connection early, so
+    # check that the body and the gzip stream are complete.
+    if response.length:
+        raise IncompleteRead(b"", response.length)
+
+    if decompressor:
+        yield decompressor.flush()
+
+        if not decompressor.eof:
+            raise IncompleteRead(b"")
+
+
+@lru_cache(maxsize=None)
 def find_set(instance_name: str) -> str:
     """
     Find the set name of the instance.
@@ -15,6 +269,9 @@ def find_set(instance_name: str) -> str:
     - CVRP instance names and their corresponding set names share the same
         first letter. the exceptions are XXL and DIMACS instances, which have
         unique instance names
+
+    The result is cached, since this function is called repeatedly for the
+    same names, e.g., when listing or downloading instances.
     """
     if re.match("(R|C|RC)[12]", instance_name):
         if "_" in instance_name:
@@ -41,3 +298,19 @@ def is_vrptw(name: str) -> bool:
     instance is a CVRP instance.
     """
     return find_set(name) in ["HG", "Solomon"]
+
+
+def instance_url(name: str) -> str:
+    """
+    Returns the CVRPLIB URL of the instance file with the passed-in name.
+    """
+    set_name = find_set(name)
+    ext = "txt" if set_name in VRPTW_SETS else "vrp"
+    return CVRPLIB_URL + f"{set_name}/{name}.{ext}"
+
+
+def solution_url(name: str) -> str:
+    """
+    Returns the CVRPLIB URL of the solution file of the passed-in instance.
+    """
+    return CVRPLIB_URL + f"{find_set(name)}/{name}.sol"
@@ -1,9 +1,17 @@
+import re
 from typing import Union
 
 from .parse_utils import infer_type, text2lines
 
 Solution = dict[str, Union[float, str, list]]
 
+# Route lines: "Route #<idx>: <customers>".
+_ROUTE_RE = re.compile(r"Route[^:]*:([^:]*)")
+
+# Keyword-value lines, split at the first colon or, if there is no colon, at
+# the first space.
+_KV_RE = re.compile(r"([^:]*):(.*)|([^ ]*) (.*)")
+
 
 def parse_solution(text: str) -> Solution:
     """
@@ -20,17 +28,18 @@ def parse_solution(text: str) -> Solution:
     dict
         The soluion data.
     """
-    solution: Solution = {"routes": []}
+    routes: list[list[int]] = []
+    solution: Solution = {"routes": routes}
 
     for line in text2lines(text):
-        if "Route" in line:
-            route = [int(idx) for idx in line.split(":")[1].split(" ") if idx]
-            solution["routes"].append(route)  # type: ignore
-        elif ":" in line or " " in line:  # Split at first colon or whitespace
-            split_at = ":" if ":" in line else " "
-            k, v = [word.strip() for word in line.split(split_at, 1)]
-            solution[k.lower()] = infer_type(v)
+        if match := _ROUTE_RE.search(line):
+            routes.append(list(map(int, match[1].split())))
+        elif match := _KV_RE.match(line):
+            groups = (1, 2) if match[1] is not None else (3, 4)
+            k, v = match.group(*groups)
+            solution[k.strip().lower()] = infer_type(v.strip())
         else:  # Ignore lines without keyword-value pairs
             continue
 
     return solution
+
@@ -15,7 +15,8 @@ def read_instance(
     Parameters
     ----------
     path
-        The path to the instance file.
+        The path to the instance file. The file is decoded as UTF-8,
+        with undecodable bytes replaced.
     instance_format
         The instance format, one of ["vrplib", "solomon"]. Default is "vrplib".
     compute_edge_weights
@@ -26,10 +27,15 @@ def read_instance(
     -------
     A dictionary that contains the instance data.
     """
-    with open(path, "r") as fi:
-        if instance_format == "vrplib":
-            return parse_vrplib(fi.read(), compute_edge_weights)
-        elif instance_format == "solomon":
-            return parse_solomon(fi.read(), compute_edge_weights)
+    with open(path, "rb") as fi:
+        # Decoding the raw bytes at once is cheaper than reading through a
+        # locale-dependent text wrapper. Undecodable bytes are replaced, so
+        # non-UTF-8 files (e.g., latin-1 comments) still load.
+        text = fi.read().decode("utf-8", errors="replace")
 
-        raise ValueError(f"Format style {instance_format} not known.")
+    if instance_format == "vrplib":
+        return parse_vrplib(text, compute_edge_weights)
+    elif instance_format == "solomon":
+        return parse_solomon(text, compute_edge_weights)
+
+    raise ValueError(f"Format style {instance_format} not known.")
@@ -11,12 +11,13 @@ def read_solution(path: Union[str, os.PathLike]) -> dict[str, Any]:
     Parameters
     ----------
     path
-        The path to the solution file.
+        The path to the solution file. The file is decoded as UTF-8,
+        with undecodable bytes replaced.
 
     Returns
     -------
     A dictionary that contains the solution data.
 
     """
-    with open(path, "r") as fi:
-        return parse_solution(fi.read())
+    with open(path, "rb") as fi:
+        return parse_solution(fi.read().decode("utf-8", errors="replace"))